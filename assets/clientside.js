@@ -0,0 +1,136 @@
+/* Clientside callbacks for the Graph Objects Explorer page. */
+
+const SLIDER_DEBOUNCE_MS = 150;
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    graph_objects_explorer: {
+        /**
+         * Apply the selected theme to an existing treemap.
+         *
+         * Only the layout is replaced; the trace data is reused as is and
+         * no server round-trip is made.
+         *
+         * @param {*} switchValue Theme switch state (truthy for light).
+         * @param {Object} figure Current treemap figure.
+         * @param {Object} themes Layout properties for each theme.
+         * @returns {Object} Updated treemap figure.
+         */
+        update_treemap_theme: function (switchValue, figure, themes) {
+            if (!figure || !figure.data) {
+                return window.dash_clientside.no_update;
+            }
+            const isLight = Array.isArray(switchValue)
+                ? switchValue.length > 0 : Boolean(switchValue);
+            const theme = themes[isLight ? 'light' : 'dark'];
+            const layout = Object.assign({}, figure.layout, theme);
+            layout.font = Object.assign(
+                {}, figure.layout && figure.layout.font, theme.font);
+            return Object.assign({}, figure, {layout: layout});
+        },
+
+        /**
+         * Apply the sort option to the traces of an existing treemap.
+         *
+         * @param {boolean} sortSwitch Sort switch state.
+         * @param {Object} figure Current treemap figure.
+         * @returns {Object} Updated treemap figure.
+         */
+        update_treemap_sort: function (sortSwitch, figure) {
+            if (!figure || !figure.data) {
+                return window.dash_clientside.no_update;
+            }
+            return Object.assign({}, figure, {
+                data: figure.data.map(
+                    trace => Object.assign({}, trace, {sort: sortSwitch}))
+            });
+        },
+
+        /**
+         * Flatten the three level sliders into the split store value.
+         *
+         * Calls are debounced per treemap index, so a drag gesture only
+         * updates the store once the sliders have settled. Superseded
+         * calls resolve with no_update.
+         *
+         * @param {number[]} slider1 Start and end values for level 1.
+         * @param {number[]} slider2 Start and end values for level 2.
+         * @param {number[]} slider3 Start and end values for level 3.
+         * @returns {Promise<number[]>} The flattened split ranges.
+         */
+        update_split_from_sliders: function (slider1, slider2, slider3) {
+            const dc = window.dash_clientside;
+            const index = dc.callback_context.inputs_list[0].id.index;
+            const pending = dc.slider_debounce = dc.slider_debounce || {};
+
+            if (pending[index]) {
+                clearTimeout(pending[index].timer);
+                pending[index].resolve(dc.no_update);
+            }
+            return new Promise(resolve => {
+                pending[index] = {
+                    resolve: resolve,
+                    timer: setTimeout(() => {
+                        delete pending[index];
+                        resolve([...slider1, ...slider2, ...slider3]);
+                    }, SLIDER_DEBOUNCE_MS)
+                };
+            });
+        },
+
+        /**
+         * Update the state of slider 3 based on slider 2's value.
+         *
+         * Slider 3 is disabled when the end value of slider 2 is 0, and its
+         * value is restored from the stored split data.
+         *
+         * @param {number[]} slider2 Start and end values for slider 2.
+         * @param {number[]} storeSplit Stored flattened split data.
+         * @returns {Array} Whether slider 3 is disabled and its value.
+         */
+        disable_slider: function (slider2, storeSplit) {
+            const level3Values = storeSplit
+                ? storeSplit.slice(4, 6) : window.dash_clientside.no_update;
+            return [slider2[1] === 0, level3Values];
+        },
+
+        /**
+         * Set the iframe source once the iframe is in the viewport.
+         *
+         * The documentation page is only requested when the iframe is
+         * actually visible; an observer still waiting for an older URL
+         * resolves with no_update.
+         *
+         * @param {string} docUrl Documentation URL to load.
+         * @returns {Promise<string>} The URL, once the iframe is visible.
+         */
+        load_iframe_when_visible: function (docUrl) {
+            const dc = window.dash_clientside;
+            const index = dc.callback_context.inputs_list[0].id.index;
+            const iframe = document.getElementById(
+                JSON.stringify({index: index, type: 'iframe'}));
+            const pending = dc.iframe_observers = dc.iframe_observers || {};
+
+            if (!docUrl) {
+                return dc.no_update;
+            }
+            if (!iframe || !('IntersectionObserver' in window)) {
+                return docUrl;
+            }
+            if (pending[index]) {
+                pending[index].observer.disconnect();
+                pending[index].resolve(dc.no_update);
+            }
+            return new Promise(resolve => {
+                const observer = new IntersectionObserver(entries => {
+                    if (entries.some(entry => entry.isIntersecting)) {
+                        observer.disconnect();
+                        delete pending[index];
+                        resolve(docUrl);
+                    }
+                });
+                pending[index] = {observer: observer, resolve: resolve};
+                observer.observe(iframe);
+            });
+        }
+    }
+});
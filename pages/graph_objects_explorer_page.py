@@ -23,11 +23,11 @@ This page is part of a larger Dash application and is registered using the
 Dash `register_page` function.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 from dash import register_page
-from dash import html, dcc, callback, MATCH
-from dash import Output, Input, State
-from dash.exceptions import PreventUpdate
+from dash import html, dcc, callback, clientside_callback, MATCH
+from dash import Output, Input, State, ClientsideFunction, Patch, no_update
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import pages.utils.fig_utils as fig_u
@@ -39,6 +39,8 @@ link_name = __name__.rsplit('.', maxsplit=1)[-1].replace('_page', '').title()
 
 register_page(__name__, name=link_name, order=0)
 
+HEADING = link_name.replace('_', ' ')
+
 TITLE = "Graph Objects Explorer"
 ABOUT = (
     "The Graph Objects Explorer is an interactive tool for visualizing "
@@ -62,30 +64,60 @@ usage_steps = [
     "Use the theme switch to toggle between light and dark modes."
 ]
 
+THEMES = {
+    'light': {
+        'template': 'plotly', 'paper_bgcolor': 'white',
+        'plot_bgcolor': 'white', 'font_color': 'black'},
+    'dark': {
+        'template': 'plotly_dark', 'paper_bgcolor': '#222222',
+        'plot_bgcolor': '#222222', 'font_color': 'white'},
+}
+
+# Walked once at import; the callbacks only slice these trees
+PRECOMPUTED_TREES = {
+    key: fig_u.keys_search(fig_u.get_go_object(key))
+    for key in fig_u.GO_INFO}
+
+RADIO_OPTIONS = tuple({"label": key, "value": key} for key in fig_u.GO_INFO)
+
+# Validated once at import so the treemap callback can emit plain dicts
+TREEMAP_LAYOUTS = {
+    name: fig_u.get_template().update(
+        **theme, title_text=None,
+        uniformtext={"minsize": 16, "mode": False}).to_plotly_json()
+    for name, theme in THEMES.items()}
+
+# Theme-only subset of the layouts, used by the clientside theme switch
+THEME_LAYOUTS = {
+    name: {
+        key: layout[key]
+        for key in ('template', 'paper_bgcolor', 'plot_bgcolor', 'font')}
+    for name, layout in TREEMAP_LAYOUTS.items()}
+
+TREEMAP_TRACE = go.Treemap(
+    marker={"cornerradius": 5}, maxdepth=4, textfont={"size": 18},
+    textposition="middle center", marker_colorscale='blues',
+).to_plotly_json()
+
 # ================= GRAPH OBJECTS EXPLORER PAGE ==== LAYOUT SECTION START ====
 
 MAIN_DIV_CHILDREN = [
     dbc.Row([dbc.Col([dcc.Link('Go back Home', href='/'),])]),
-    dbc.Row([dbc.Col([html.H3(
-        f"{link_name.replace('_', ' ')}",
-        style=styles.heading_3_style)])]),
+    dbc.Row([dbc.Col([html.H3(HEADING, style=styles.heading_3_style)])]),
     dbc.Row([
         dcu.app_description(TITLE, ABOUT, features, usage_steps), html.Hr()]),
     dbc.Row([dbc.Col([dbc.RadioItems(
-        options=[
-            {"label": key, "value": key}
-            for _, key in enumerate(fig_u.GO_INFO)],
-        id='checklist', inline=True, switch=False,
+        options=RADIO_OPTIONS, id='checklist', inline=True, switch=False,
         style=styles.radioitems_style
     ),
     ])]),
-    dcc.Store(id='store', data={"max_count": 0}),
+    dcc.Store(id='treemap_themes', data=THEME_LAYOUTS),
     html.Hr(),
     html.Div(id='container'),
 ]
 
 layout = dbc.Container(
-    [html.Div(MAIN_DIV_CHILDREN, style=styles.GLOBAL_STYLE)], fluid=True)
+    MAIN_DIV_CHILDREN, style=styles.GLOBAL_STYLE, fluid=True)
 
 
 def create_labeled_range_slider_column(
@@ -96,7 +128,8 @@ def create_labeled_range_slider_column(
 
     This function generates a Dash Bootstrap column containing a labeled
     range slider. The slider is configured with specific properties and a
-    tooltip.
+    tooltip. Its value is only updated once a handle is released, so a drag
+    does not trigger the treemap callbacks on every step.
 
     Args:
         slider_id (dict): A dictionary used as the ID for the range slider.
@@ -115,7 +148,8 @@ def create_labeled_range_slider_column(
             className="d-flex justify-content-center align-items-center"),
         dcc.RangeSlider(
             id=slider_id, value=[min_val, 500], min=min_val, step=1,
-            allowCross=False, pushable=pushable_val, marks=None, tooltip={
+            allowCross=False, pushable=pushable_val, marks=None,
+            updatemode='mouseup', tooltip={
                 "placement": "bottomLeft", "always_visible": True,
                 "style": {"fontSize": "14px"}}),
     ], xs=12, md={"size": 4})
@@ -173,7 +207,7 @@ def create_main_controls_accordion(index_id: int = 0):
     Create the main controls accordion with associated stores.
 
     This function generates a Dash Bootstrap row containing:
-    - Two dcc.Store components for storing state
+    - Three dcc.Store components for storing state
     - An accordion with two main sections:
         1. Filter controls
             (created by create_filter_controls_accordion())
@@ -195,6 +229,8 @@ def create_main_controls_accordion(index_id: int = 0):
             id={'type': 'store_len_lev_1', 'index': index_id}, data=None),
         dcc.Store(
             id={'type': 'store_split', 'index': index_id}, data=None),
+        dcc.Store(
+            id={'type': 'fig_cache_key', 'index': index_id}, data=None),
         html.Div([
             create_three_level_filter_row()],
             style={'display': 'none'},
@@ -220,6 +256,7 @@ def create_graph_and_iframe_section(index_id: int = 0):
         id={'type': 'col_graph', 'index': index_id})
 
     iframe_section_column = dbc.Col([
+        dcc.Store(id={'type': 'doc_url', 'index': index_id}, data=None),
         dbc.Row([dbc.Col([html.A(
             id={'type': 'click_data', 'index': index_id})])]),
         html.Iframe(
@@ -235,309 +272,323 @@ def create_graph_and_iframe_section(index_id: int = 0):
 
     return graph_and_iframe_section
 
+
+# Built once; display_components sends the same tree for every selection
+MAIN_BODY = html.Div([
+    create_main_controls_accordion(), html.Hr(),
+    create_graph_and_iframe_section(), html.Hr()])
+
 # =================== GRAPH OBJECTS EXPLORER PAGE ==== LAYOUT SECTION END ====
 
 
-@callback(
-    Output('store', 'data'),
-    Input('checklist', 'value'),
-    State('store', 'data')
-)
-def reset_store_count_on_checklist_change(
-        checklist: List[str], data: Dict[str, Any]) -> Dict[str, Any]:
+@lru_cache(maxsize=128)
+def _cached_keys_search(
+        main_checklist: str, split_key: Tuple[int, ...] | None
+) -> Tuple[List[str], List[str], List[str], Tuple[int, int, int]]:
     """
-    Reset the count in the data store when the checklist value changes.
+    Memoized split of the precomputed tree of a graph object.
 
-    This callback function is triggered whenever the value of the
-    'checklist' component changes. It updates the 'count' key in the data
-    store to 1 if a checklist item is selected.
+    The tree structure only depends on the selected graph object and the
+    slider ranges, so theme or sort changes are served from the cache.
+    The graph object itself is never walked here; the slider ranges are
+    applied to `PRECOMPUTED_TREES` with `fig_u.apply_split`.
 
     Args:
-        checklist (List[str]):
-            The currently selected values from the checklist.
-            Empty list if no selection.
-        data (Dict[str, Any]):
-            The current data stored in the 'store' component.
+        main_checklist (str): Main category selection (a `GO_INFO` key).
+        split_key (Tuple[int, ...] | None): Flattened split ranges as
+            (s1_start, s1_end, s2_start, s2_end, s3_start, s3_end).
 
     Returns:
-        Dict[str, Any]:
-            Updated data dictionary.
-            If a checklist item is selected, the 'count' key is set to 1.
-            Otherwise, the original data is returned unchanged.
+        Tuple: The parents, labels, ids and level lengths of the tree.
     """
-    if checklist:
-        data["max_count"] = 1
-    return data
+    split = None
+    if split_key is not None:
+        split = {
+            "level_1": {"start": split_key[0], "end": split_key[1]},
+            "level_2": {"start": split_key[2], "end": split_key[3]},
+            "level_3": {"start": split_key[4], "end": split_key[5]}
+        }
+    return fig_u.apply_split(PRECOMPUTED_TREES[main_checklist], split)
 
 
 @callback(
     Output('container', 'children'),
-    Input('store', 'data')
+    Input('checklist', 'value'),
+    prevent_initial_call=True
 )
-def display_components(data: Dict[str, Any]) -> List[html.Div]:
+def display_components(checklist: str | None) -> List[html.Div]:
     """
-    Generate and display components based on the data in the store.
+    Generate and display components when a graph object is selected.
+
+    This callback function is triggered whenever the value of the
+    'checklist' component changes. It creates various UI components
+    including range sliders, switches, and a treemap graph. The function
+    organizes these components into a structured layout using Dash
+    Bootstrap Components.
 
-    This callback function is triggered when the 'store' data changes.
-    It creates various UI components including range sliders, accordions,
-    switches, and a treemap graph. The function organizes these components
-    into a structured layout using Dash Bootstrap Components.
+    The components are built once at import as `MAIN_BODY`. Sending them
+    again on each selection still resets the sliders and stores.
 
     Args:
-        data: The current data stored in the 'store' component.
-            Expected to contain a 'count' key.
+        checklist: The selected graph object, or None if no selection.
 
     Returns:
-        A list of Dash components to be rendered in the 'container'.
-
-    Raises:
-        PreventUpdate: If data['count'] is 0, preventing unnecessary updates.
+        A list of Dash components to be rendered in the 'container',
+        or no_update if no graph object is selected.
 
     Components created:
     - Range sliders for level 1, 2, and 3 items
     - Sort switch
-    - Color theme selection with reverse colors option
     - Treemap graph
     - iframe for displaying additional content
     """
-    children: List[html.Div] = []
-    if data["max_count"] == 0:
-        raise PreventUpdate
+    if not checklist:
+        return no_update
 
-    children.append(html.Div([
-        create_main_controls_accordion(), html.Hr(),
-        create_graph_and_iframe_section(), html.Hr()]))
-    return children
+    return [MAIN_BODY]
 
 
 @callback(
     Output({'type': 'treemap', 'index': MATCH}, 'figure'),
     Output({'type': 'treemap', 'index': MATCH}, 'style'),
     Output({'type': 'store_len_lev_1', 'index': MATCH}, 'data'),
+    Output({'type': 'slider_1', 'index': MATCH}, 'max'),
     Output({'type': 'slider_2', 'index': MATCH}, 'max'),
     Output({'type': 'slider_3', 'index': MATCH}, 'max'),
-    Input('theme_switch_value_store', 'data'),
+    Output({'type': 'div_item', 'index': MATCH}, 'style'),
+    Output({'type': 'fig_cache_key', 'index': MATCH}, 'data'),
     Input({'type': 'store_split', 'index': MATCH}, 'data'),
-    Input({'type': 'sort_switch', 'index': MATCH}, 'value'),
+    State('theme_switch_value_store', 'data'),
+    State({'type': 'sort_switch', 'index': MATCH}, 'value'),
     State({'type': 'store_len_lev_1', 'index': MATCH}, 'data'),
+    State({'type': 'fig_cache_key', 'index': MATCH}, 'data'),
     State('checklist', 'value')
 )
 def update_treemap_and_store(
-        switch: bool, split: Any, sort_switch: bool,
-        store_len_lev_1: int | None, main_checklist: str
-) -> Tuple[go.Figure, Dict[str, str], int, int, int]:
+        split: List[int] | None, switch: bool, sort_switch: bool,
+        store_len_lev_1: int | None, fig_cache_key: List[Any] | None,
+        main_checklist: str
+) -> Tuple[
+        Dict[str, Any] | Patch, Dict[str, str], int, int, int, int,
+        Dict[str, str], List[Any]]:
     """
     Update the treemap visualization and related data storage.
 
     This function creates or updates a treemap based on user selections,
     applying theme settings and storing relevant data for future use.
+    Later theme and sort changes are applied by clientside callbacks.
+    The figure is returned as a plain dict built from the precomputed
+    layout and trace, so no Plotly validation runs per call.
+
+    The tree itself is memoized by `_cached_keys_search`. When the inputs
+    match the key of the figure already displayed, the update is skipped.
+
+    The level 1 slider maximum and the filter controls visibility are set
+    here too, so no extra callback has to receive the figure back.
+
+    Once the treemap exists, only the trace arrays and the sort flag are
+    sent as a Patch; the layout is already up to date on the client.
 
     Args:
-        checklist (str): Selected color scale option.
+        split (Optional[List[int]]): Flattened split ranges from store.
         switch (bool): Theme switch state (True for light, False for dark).
-        split (Any): Split data from store.
         sort_switch (bool): Sort switch state.
         store_len_lev_1 (Optional[int]): Previously stored level 1 length.
+        fig_cache_key (Optional[List[Any]]): Key of the displayed figure.
         main_checklist (str): Main category selection.
 
     Returns:
-        Tuple[go.Figure, Dict[str, str], int, int, int]: Contains:
-            - go.Figure: Updated treemap figure.
+        Tuple: Contains:
+            - Dict[str, Any] | Patch: Updated treemap figure or patch.
             - Dict[str, str]: Style dictionary for treemap visibility.
             - int: Updated count of level 1 items.
+            - int: Max value for slider 1.
             - int: Max value for slider 2.
             - int: Max value for slider 3.
+            - Dict[str, str]: Style dictionary for div item visibility.
+            - List[Any]: Cache key of the returned figure.
+        no_update is returned for every output if the displayed figure
+        already matches the inputs.
     """
-    treee_fig = go.Figure(layout=fig_u.TEMPLATE)
-    theme = {
-        'template': 'plotly' if switch else 'plotly_dark',
-        'paper_bgcolor': 'white' if switch else '#222222',
-        'plot_bgcolor': 'white' if switch else '#222222',
-        'font_color': 'black' if switch else 'white',
-        'title_text': None, 'uniformtext': {"minsize": 16, "mode": False}
-    }
-    treee_fig.update_layout(**theme)
-
-    treee_fig.add_trace(go.Treemap(
-        marker={"cornerradius": 5}, maxdepth=4, sort=sort_switch))
-
-    parents, labels, ids, len_levels = fig_u.keys_search(
-        fig_u.GO_INFO[main_checklist]['object'], split)
-
-    treee_fig.update_traces(
-        go.Treemap(
-            parents=parents, labels=labels, ids=ids, textfont={"size": 18},
-            textposition="middle center", marker_colorscale='blues',
-        ))
+    split_key = None if split is None else tuple(split)
+
+    cache_key = [
+        main_checklist, None if split_key is None else list(split_key),
+        bool(switch), bool(sort_switch)]
+    if fig_cache_key == cache_key:
+        return no_update, no_update, no_update, no_update, \
+            no_update, no_update, no_update, no_update
+
+    parents, labels, ids, len_levels = _cached_keys_search(
+        main_checklist, split_key)
+
+    if store_len_lev_1 is not None:
+        treee_fig = Patch()
+        treee_fig['data'][0]['parents'] = parents
+        treee_fig['data'][0]['labels'] = labels
+        treee_fig['data'][0]['ids'] = ids
+        treee_fig['data'][0]['sort'] = sort_switch
+    else:
+        treee_fig = {
+            'data': [{
+                **TREEMAP_TRACE, 'sort': sort_switch,
+                'parents': parents, 'labels': labels, 'ids': ids}],
+            'layout': TREEMAP_LAYOUTS['light' if switch else 'dark']}
 
     callback_count = \
         store_len_lev_1 if store_len_lev_1 is not None else len_levels[0]
 
-    return treee_fig, {'display': ''}, \
-        callback_count, len_levels[1], len_levels[2]
+    return treee_fig, {'display': ''}, callback_count, callback_count, \
+        len_levels[1], len_levels[2], {'display': ''}, cache_key
 
 
-@callback(
+clientside_callback(
+    ClientsideFunction(
+        namespace='graph_objects_explorer',
+        function_name='update_treemap_theme'),
+    Output({'type': 'treemap', 'index': MATCH}, 'figure',
+           allow_duplicate=True),
+    Input('theme_switch_value_store', 'data'),
+    State({'type': 'treemap', 'index': MATCH}, 'figure'),
+    State('treemap_themes', 'data'),
+    prevent_initial_call=True
+)
+
+
+clientside_callback(
+    ClientsideFunction(
+        namespace='graph_objects_explorer',
+        function_name='update_treemap_sort'),
+    Output({'type': 'treemap', 'index': MATCH}, 'figure',
+           allow_duplicate=True),
+    Input({'type': 'sort_switch', 'index': MATCH}, 'value'),
+    State({'type': 'treemap', 'index': MATCH}, 'figure'),
+    prevent_initial_call=True
+)
+
+
+clientside_callback(
+    ClientsideFunction(
+        namespace='graph_objects_explorer',
+        function_name='update_split_from_sliders'),
     Output({'type': 'store_split', 'index': MATCH}, 'data'),
     Input({'type': 'slider_1', 'index': MATCH}, 'value'),
     Input({'type': 'slider_2', 'index': MATCH}, 'value'),
     Input({'type': 'slider_3', 'index': MATCH}, 'value'),
 )
-def update_treemap_based_on_slider_inputs(
-        slider_1_value: List[int], slider_2_value: List[int],
-        slider_3_value: List[int]
-) -> Dict[str, Dict[str, int]]:
-    """
-    Update the treemap visualization based on slider inputs.
-
-    This function takes the values from three sliders and uses them to create
-    a dictionary that defines the split ranges for each level of the treemap.
 
-    Args:
-        slider_1_value (List[int]): Start and end values for level 1 slider.
-        slider_2_value (List[int]): Start and end values for level 2 slider.
-        slider_3_value (List[int]): Start and end values for level 3 slider.
 
-    Returns:
-        Dict[str, Dict[str, int]]: A nested dictionary containing the split
-        ranges for each level of the treemap.
-    """
-    split = {
-        "level_1": {"start": slider_1_value[0], "end": slider_1_value[1]},
-        "level_2": {"start": slider_2_value[0], "end": slider_2_value[1]},
-        "level_3": {"start": slider_3_value[0], "end": slider_3_value[1]}
-    }
-    return split
-
-
-@callback(
+clientside_callback(
+    ClientsideFunction(
+        namespace='graph_objects_explorer',
+        function_name='disable_slider'),
     Output({'type': 'slider_3', 'index': MATCH}, 'disabled'),
     Output({'type': 'slider_3', 'index': MATCH}, 'value'),
     Input({'type': 'slider_2', 'index': MATCH}, 'value'),
     State({'type': 'store_split', 'index': MATCH}, 'data'),
     prevent_initial_call=True
 )
-def disable_slider(
-        slider_2_value: List[int], store_split: Dict[str, Dict[str, int]]
-) -> Tuple[bool, List[int]]:
-    """
-    Update the state of slider 3 based on slider 2's value.
-
-    This function disables slider 3 if the end value of slider 2 is 0,
-    and updates slider 3's value based on the stored split data.
-
-    Args:
-        slider_2_value (List[int]): Start and end values for slider 2.
-        store_split (Dict[str, Dict[str, int]]):
-            Stored split data for all levels.
-
-    Returns:
-        Tuple[bool, List[int]]: A tuple containing:
-            - bool: Whether slider 3 should be disabled.
-            - List[int]: Updated values for slider 3.
-    """
-    level_3_values = list(store_split['level_3'].values())
-    if slider_2_value[1] == 0:
-        return True, level_3_values
-    return False, level_3_values
 
 
 @callback(
     Output({'type': 'click_data', 'index': MATCH}, 'children'),
     Output({'type': 'click_data', 'index': MATCH}, 'href'),
-    Output({'type': 'iframe', 'index': MATCH}, 'src'),
-    Output({'type': 'iframe', 'index': MATCH}, 'style'),
+    Output({'type': 'doc_url', 'index': MATCH}, 'data'),
     Output({'type': 'col_graph', 'index': MATCH}, 'md'),
     Output({'type': 'col_iframe', 'index': MATCH}, 'style'),
     Input({'type': 'treemap', 'index': MATCH}, 'clickData'),
     State('checklist', 'value'),
-    State({'type': 'iframe', 'index': MATCH}, 'style'),
+    prevent_initial_call=True
 )
 def update_click_data_display(
-        click_data: Dict[str, Any] | None, checklist: str,
-        iframe_style: Dict[str, Any]
-) -> Tuple[str, str, str, Dict[str, Any], Dict[str, int], Dict[str, str]]:
+        click_data: Dict[str, Any] | None, checklist: str
+) -> Tuple[str, str, str, Dict[str, int], Dict[str, str]]:
     """
     Update the display of click data for a treemap visualization.
 
     This function processes the click event data from a treemap and updates
     a text display. If no data point has been clicked, it shows a default
     message. Otherwise, it displays the ID of the clicked data point and
-    updates the iframe source and style based on the click data.
+    stores the documentation URL for the iframe callbacks.
+
+    The section existence check and the iframe loading are done by separate
+    callbacks, so the click response does not wait on any network request.
 
     Args:
         click_data: The click event data from the treemap.
             If None, no data point has been clicked.
         checklist: The selected value from the checklist.
-        iframe_style: The style dictionary for the iframe.
 
     Returns:
         tuple: Contains the following elements:
             - str: The URL for the clicked data point.
             - str: The href for the clicked data point.
-            - str: The src URL for the iframe.
-            - Dict[str, Any]: The updated style dictionary for the iframe.
+            - str: The documentation URL for the iframe.
             - Dict[str, int]: The md size for the column containing the graph.
             - Dict[str, str]: The style dictionary for the iframe column.
+        no_update is returned for every output if the click data has no
+        usable point id.
     """
     if click_data is None:
-        raise PreventUpdate
+        return no_update, no_update, no_update, no_update, no_update
 
-    click_keys = list(click_data["points"][0].keys())
-    if all(key in click_keys for key in ['id', 'root']):
-        clicked_id = click_data["points"][0]["id"]
-    elif all(key in click_keys for key in ['entry']):
-        clicked_id = click_data["points"][0]["entry"]
+    point = click_data["points"][0]
+    if 'id' in point and 'root' in point:
+        clicked_id = point["id"]
+    elif 'entry' in point:
+        clicked_id = point["entry"]
     else:
-        raise PreventUpdate
-
-    clicked_id_split = clicked_id.split('*')
+        return no_update, no_update, no_update, no_update, no_update
 
-    url_post = fig_u.GO_INFO[checklist]['url_post']
-    url_pre_section = fig_u.GO_INFO[checklist]['url_pre_section']
-
-    url_pre = 'https://plotly.com/python/reference/'
-    doc_url = f"{url_pre}{url_post}/#{url_pre_section}"
-
-    doc_url += ''.join(f'-{pat_str}' for pat_str in clicked_id_split)
-
-    iframe_style['display'] = '' if web_u.check_section_exists(
-        doc_url) else 'none'
-
-    if clicked_id_split[0][0].isupper():
-        doc_url = doc_url.split('#')[0]
-        iframe_style['display'] = ''
+    go_info = fig_u.GO_INFO[checklist]
+    if clicked_id[0].isupper():
+        doc_url = go_info.doc_page_url
+    else:
+        doc_url = '-'.join(
+            [go_info.doc_url_base, *clicked_id.split('*')])
 
-    return f'{doc_url}', f'{doc_url}', doc_url, \
-        iframe_style, {"size": 6}, {'display': ''}
+    return doc_url, doc_url, doc_url, {"size": 6}, {'display': ''}
 
 
 @callback(
-    Output({'type': 'slider_1', 'index': MATCH}, 'max'),
-    Output({'type': 'div_item', 'index': MATCH}, 'style'),
-    Input({'type': 'treemap', 'index': MATCH}, 'figure'),
-    State({'type': 'store_len_lev_1', 'index': MATCH}, 'data')
+    Output({'type': 'iframe', 'index': MATCH}, 'style'),
+    Input({'type': 'doc_url', 'index': MATCH}, 'data'),
+    State({'type': 'iframe', 'index': MATCH}, 'style'),
+    prevent_initial_call=True
 )
-def update_div_and_slider_based_on_treemap(
-    _treemap_figure: Any,
-    store: int
-) -> Tuple[int, Dict[str, str]]:
+def update_iframe_display(
+        doc_url: str | None, iframe_style: Dict[str, Any]
+) -> Dict[str, Any]:
     """
-    Update div items and range slider based on treemap selection.
+    Show the iframe only if the documentation section exists.
 
-    This function updates the maximum value of a range slider and the
-    visibility of an div item.
+    URLs without a section anchor point to a whole reference page and are
+    always shown.
 
     Args:
-        _treemap_figure (Any): Placeholder for unused treemap figure input.
-        store (int): The maximum value for the range slider.
+        doc_url: The documentation URL of the clicked data point.
+        iframe_style: The style dictionary for the iframe.
 
     Returns:
-        tuple: Contains the following elements:
-            - int: Maximum value for the range slider.
-            - dict: Style dictionary for div item visibility.
+        Dict[str, Any]: The updated style dictionary for the iframe, or
+        no_update if no documentation URL is stored yet.
     """
-    return store, {'display': ''}
+    if doc_url is None:
+        return no_update
+
+    iframe_style['display'] = '' if '#' not in doc_url or \
+        web_u.check_section_exists(doc_url) else 'none'
+    return iframe_style
+
+
+clientside_callback(
+    ClientsideFunction(
+        namespace='graph_objects_explorer',
+        function_name='load_iframe_when_visible'),
+    Output({'type': 'iframe', 'index': MATCH}, 'src'),
+    Input({'type': 'doc_url', 'index': MATCH}, 'data'),
+    prevent_initial_call=True
+)
 
 
 # graph_objs_list = [
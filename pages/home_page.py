@@ -14,6 +14,8 @@ link_name = __name__.rsplit('.', maxsplit=1)[-1].replace('_page', '').title()
 
 dash.register_page(__name__, name=link_name, path='/')
 
+HEADING = link_name.replace('_', ' ')
+
 TITLE = "Home Page"
 ABOUT = (
     "The Home page serves as the main entry point and "
@@ -37,7 +39,7 @@ usage_steps = [
 
 layout = dbc.Container([html.Div([
     dbc.Row([dbc.Col([html.H3(
-        f"{link_name.replace('_', ' ')}", style=styles.heading_3_style)])]),
+        HEADING, style=styles.heading_3_style)])]),
     dbc.Row([dcu.app_description(TITLE, ABOUT, features, usage_steps)]),
     html.Div(id='links_display'),
 ], style=styles.GLOBAL_STYLE)
@@ -73,5 +75,5 @@ def display_links(links: list[dict] | None) -> html.Div | str:
 
     return html.Div([
         html.Div(dcc.Link(link['name'], href=link['path']))
-        for link in links
-    ][:-1])
+        for link in links[:-1]
+    ])
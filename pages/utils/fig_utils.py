@@ -12,9 +12,13 @@ manipulating Plotly figures. It includes:
 Main functions:
     find_last_options: Find and add last options to the tree structure
     find_mid_options: Find and add middle options to the tree structure
+    get_init_parameters: Get the cached constructor parameter names of a type
     find_first_options: Find first options and initialize the tree structure
     keys_search: Search keys in a hierarchical structure
-    create_go_info_item: Generate a sub-dictionary for a Plotly graph object
+    apply_split: Apply split ranges to an already searched tree
+    create_go_info_item: Generate the information item for a graph object
+    get_go_object: Get the cached graph object instance of a GO_INFO entry
+    get_template: Get a copy of the default layout template to customize
 
 The module is designed to assist in the creation and customization of Plotly
 figures, providing tools for exploring and manipulating Plotly object
@@ -22,19 +26,24 @@ structures.
 """
 
 import inspect
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from collections import Counter
+from itertools import chain, repeat
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import plotly.graph_objects as go
 from _plotly_utils.exceptions import PlotlyKeyError
 
 
+# Shared by every graph; the button lists are tuples so they can't be edited
 GRAPH_CONFIG = {
     'displayModeBar': "hover", 'displaylogo': False, 'editable': False,
-    'modeBarButtonsToRemove': [
+    'modeBarButtonsToRemove': (
         'zoom2d', 'pan2d', 'zoomIn2d', 'lasso2d', 'select2d',
-        'zoomOut2d', 'autoScale2d', 'resetScale2d'],
-    'modeBarButtonsToAdd': [
+        'zoomOut2d', 'autoScale2d', 'resetScale2d'),
+    'modeBarButtonsToAdd': (
         'drawline', 'drawopenpath', 'drawclosedpath',
-        'drawcircle', 'drawrect', 'eraseshape'],
+        'drawcircle', 'drawrect', 'eraseshape'),
     'doubleClickDelay': 600, 'scrollZoom': False,
     'toImageButtonOptions': {
         'format': 'jpeg', 'height': None, 'width': None, 'scale': 1}}
@@ -54,7 +63,15 @@ MARKER_COLORSCALE = [
     'tropic', 'turbid', 'turbo', 'twilight', 'viridis', 'ylgn', 'ylgnbu',
     'ylorbr', 'ylorrd']
 
+DOC_URL_PRE = 'https://plotly.com/python/reference/'
 
+# Constructor parameters that are not shown as first level options
+MAIN_KEYS_TO_REMOVE = frozenset({
+    'self', 'arg', 'kwargs', 'annotations', 'coloraxis', 'geo', 'images',
+    'mapbox', 'polar', 'scene', 'selections', 'shapes', 'sliders',
+    'smith', 'ternary', 'updatemenus', 'xaxis', 'yaxis'})
+
+# Shared instance, validated once; use get_template() to customize a copy
 TEMPLATE = go.Layout(
     margin={"l": 0, "r": 0, "t": 0, "b": 0}, showlegend=True,
     hoverlabel={"font_family": 'Droid Sans', "namelength": -1},
@@ -82,7 +99,7 @@ TEMPLATE = go.Layout(
 
 
 def find_last_options(
-    tree: Dict[str, List[str]], zipped: List[List[str]],
+    tree: Dict[str, List[str]], mid_start: int,
     root_go_obj: go.Figure, root_key: str, split: Dict[str, int]
 ) -> Dict[str, List[str]]:
     """Find and add last options to the tree structure.
@@ -90,8 +107,8 @@ def find_last_options(
     Args:
         tree (Dict[str, List[str]]): The current tree structure
             containing 'parents', 'labels', and 'ids'.
-        zipped (List[List[str]]): The zipped list of existing tree
-            nodes to compare against.
+        mid_start (int): The index of the first node added by
+            `find_mid_options`; only the nodes from there are expanded.
         root_go_obj (go.Figure): The source dictionary with possible
             options for each label.
         root_key (str): The root key prefix for the current level
@@ -102,25 +119,23 @@ def find_last_options(
             last options.
     """
 
-    # Find differences between current zipped list and tree's zip
-    zip_diff = [
-        item for item in
-        sorted(list(set(zip(tree["parents"], tree["labels"], tree["ids"]))))
-        if item not in zipped
-    ]
+    # The nodes added by find_mid_options, in sorted order
+    zip_diff = sorted(zip(
+        tree["parents"][mid_start:], tree["labels"][mid_start:],
+        tree["ids"][mid_start:]))
     list_max: int = 0
+    prefix = f'{root_key}*'
 
     # Process each difference
     for parent, label, zip_id in zip_diff:
         # Adjust the parent key by removing the root_key prefix
-        parent = parent.replace(f'{root_key}*', '')
+        parent = parent.replace(prefix, '')
         try:
             # Get and sort new labels from the root_go_obj
             if not isinstance(root_go_obj[parent][label], (str, tuple)):
-                new_labels = [
-                    key for key in sorted(
-                        list(set(root_go_obj[parent][label])))
-                    if not key.endswith('src')]
+                new_labels = sorted({
+                    key for key in root_go_obj[parent][label]
+                    if not key.endswith('src')})
                 list_max = max(list_max, len(new_labels))
                 if split is not None:
                     try:
@@ -169,10 +184,9 @@ def find_mid_options(
         try:
             # Attempt to get and sort unique options from root_go_obj
             if not isinstance(root_go_obj[label], (str, tuple)):
-                options[label] = [
-                    key for key in sorted(set(root_go_obj[label]))
-                    if not key.endswith('src')
-                    and not key.endswith('defaults')]
+                options[label] = sorted({
+                    key for key in root_go_obj[label]
+                    if not key.endswith(('src', 'defaults'))})
                 list_max = max(list_max, len(options[label]))
             if split is not None:
                 try:
@@ -184,31 +198,44 @@ def find_mid_options(
             # If there's a TypeError or PlotlyKeyError, skip this label
             continue
 
-    # Iterate over the collected options to extend the tree structure
-    for new_key, new_options in options.items():
-        # Extend the 'parents' list in the tree with new parent keys
-        tree["parents"].extend([
-            f'{root_key}*{new_key}'
-            if root_key != "" else f'{new_key}'] * len(new_options))
+    prefix = f'{root_key}*' if root_key != "" else ''
+
+    # Extend each tree list once with the options of all labels
+    tree["parents"].extend(chain.from_iterable(
+        repeat(f'{prefix}{new_key}', len(new_options))
+        for new_key, new_options in options.items()))
 
-        # Extend the 'labels' list in the tree with new options
-        tree["labels"].extend(new_options)
+    tree["labels"].extend(chain.from_iterable(options.values()))
 
-        # Extend the 'ids' list in the tree with new unique IDs
-        tree["ids"].extend(
-            [f'{root_key}*{new_key}*{option}' if root_key != "" else
-             f'{new_key}*{option}' for option in new_options])
+    tree["ids"].extend(
+        f'{prefix}{new_key}*{option}'
+        for new_key, new_options in options.items()
+        for option in new_options)
 
     # Return the updated tree structure
     return tree, list_max
 
 
+@lru_cache(maxsize=None)
+def get_init_parameters(object_type: type) -> Tuple[str, ...]:
+    """Get the parameter names of a graph object type's constructor.
+
+    Building an `inspect.signature` is slow and its result only depends on
+    the type, so the names are cached per type.
+
+    Args:
+        object_type (type): The Plotly graph object type (e.g., go.Bar).
+
+    Returns:
+        Tuple[str, ...]: The parameter names of `object_type.__init__`.
+    """
+    return tuple(inspect.signature(object_type.__init__).parameters)
+
+
 def find_first_options(
     figure: Dict[str, List[str]], root_key: str,
     split: Optional[Dict[str, int]] = None
-) -> Tuple[
-        Dict[str, List[str]], Dict[str, List[str]],
-        List[Tuple[str, str, str]], int]:
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], int]:
     """Find first options and initialize the tree structure.
 
     Args:
@@ -219,69 +246,110 @@ def find_first_options(
 
     Returns:
         Tuple containing the tree structure, the root figure, and
-        the zipped list of tree nodes.
+        the number of first level nodes.
     """
 
     tree = {}
 
-    signature = inspect.signature(figure.__init__)
-
-    to_remove = [
-        'self', 'arg', 'kwargs', 'annotations', 'coloraxis', 'geo', 'images',
-        'mapbox', 'polar', 'scene', 'selections', 'shapes', 'sliders',
-        'smith', 'ternary', 'updatemenus', 'xaxis', 'yaxis'
-    ]
-    main_keys = []
-    for param_name, _ in signature.parameters.items():
-        if param_name not in to_remove \
-                and not param_name.endswith('src')\
-                and not param_name.endswith('defaults'):
-            main_keys.append(param_name)
+    main_keys = [
+        param_name for param_name in get_init_parameters(type(figure))
+        if param_name not in MAIN_KEYS_TO_REMOVE
+        and not param_name.endswith(('src', 'defaults'))]
 
     class_name = figure.__class__.__name__
 
     # Initialize labels, parents, and ids for the tree
     labels = [class_name] + main_keys
     parents = [''] + [class_name] * len(main_keys)
-    ids = [class_name] + [
-        f'{parent}*{label}' if root_key != "" else f'{label}'
-        for parent, label in zip(parents[1:], labels[1:])
-    ]
+    prefix = f'{class_name}*' if root_key != "" else ''
+    ids = [class_name] + [f'{prefix}{label}' for label in main_keys]
 
-    # Split and zip list of parents, labels, and ids
-    zipped = list(zip(parents, labels, ids))
+    # Split the lists of parents, labels, and ids
+    level_1 = slice(None)
     if split is not None:
         try:
-            zipped = zipped[split['level_1']['start']:split['level_1']['end']]
+            level_1 = slice(
+                split['level_1']['start'], split['level_1']['end'])
         except KeyError:
             pass
 
-    # Unzip the sorted and deduplicated list into separate lists
-    parents, labels, ids = zip(*zipped)
     tree["parents"], tree["labels"], tree["ids"] = (
-        list(parents), list(labels), list(ids)
-    )
+        parents[level_1], labels[level_1], ids[level_1])
 
-    # Return the initialized tree, root figure, and zipped list
-    return tree, figure, zipped, len(zipped)
+    # Return the initialized tree, root figure, and first level length
+    return tree, figure, len(tree["ids"])
 
 
-def has_duplicates(lst):
-    """Check duplicates."""
-    result = len(lst) != len(set(lst))
+def apply_split(
+    tree: Tuple[List[str], List[str], List[str], Tuple[int, int, int]],
+    split: Optional[Dict[str, Dict[str, int]]] = None
+) -> Tuple[List[str], List[str], List[str], Tuple[int, int, int]]:
+    """Apply split ranges to a tree returned by `keys_search`.
+
+    The result is the same as calling `keys_search` with `split`, but the
+    nodes are taken from a tree searched once without a split, so the
+    Plotly graph object is not walked again.
+
+    Args:
+        tree (Tuple): The output of `keys_search` called without a split
+            and with the default `root_key`.
+        split (Dict[str, Dict[str, int]], optional): The start and end
+            indices for each level of the tree. Defaults to None.
+
+    Returns:
+        Tuple[List[str], List[str], List[str], Tuple[int, int, int]]:
+            The parents, labels and ids of the split tree, and the number
+            of items available at each level.
+    """
+    if split is None:
+        return tree
+
+    def level_slice(level: str) -> slice:
+        try:
+            return slice(split[level]['start'], split[level]['end'])
+        except KeyError:
+            return slice(None)
 
-    counts = {}
-    for item in lst:
-        if item in counts:
-            counts[item] += 1
-        else:
-            counts[item] = 1
+    parents, labels, ids, (first_len, _, _) = tree
 
-    duplicates = [item for item, count in counts.items() if count > 1]
+    # Group the nodes below the first level by their parent
+    children: Dict[str, List[Tuple[str, str, str]]] = {}
+    for node in zip(
+            parents[first_len:], labels[first_len:], ids[first_len:]):
+        children.setdefault(node[0], []).append(node)
 
-    if result:
-        print("Duplicated items:", duplicates)
-    return result
+    zipped = list(zip(
+        parents[:first_len], labels[:first_len],
+        ids[:first_len]))[level_slice('level_1')]
+
+    mid_nodes: List[Tuple[str, str, str]] = []
+    len_lv_2 = 0
+    for _, label, _ in zipped:
+        options = children.get(label, [])
+        len_lv_2 = max(len_lv_2, len(options))
+        mid_nodes.extend(options[level_slice('level_2')])
+
+    last_nodes: List[Tuple[str, str, str]] = []
+    len_lv_3 = 0
+    for _, _, mid_id in sorted(set(mid_nodes)):
+        options = children.get(mid_id, [])
+        len_lv_3 = max(len_lv_3, len(options))
+        last_nodes.extend(options[level_slice('level_3')])
+
+    nodes = [*zipped, *mid_nodes, *last_nodes]
+
+    return [node[0] for node in nodes], [node[1] for node in nodes], \
+        [node[2] for node in nodes], (len(zipped), len_lv_2, len_lv_3)
+
+
+def has_duplicates(lst):
+    """Check duplicates."""
+    if len(lst) == len(set(lst)):
+        return False
+
+    duplicates = [item for item, count in Counter(lst).items() if count > 1]
+    print("Duplicated items:", duplicates)
+    return True
 
 
 def keys_search(
@@ -295,6 +363,9 @@ def keys_search(
     `find_mid_options`, and `find_last_options` functions to build a tree
     structure of parents, labels, and ids.
 
+    The same property names and id prefixes repeat across the tree, so the
+    returned strings are interned.
+
     Args:
         go_obj (go.Figure): The source hierarchical structure with possible
             options.
@@ -311,7 +382,7 @@ def keys_search(
     """
 
     # Initialize the tree structure with first options
-    tree, root_go_obj, zipped, zipped_len = find_first_options(
+    tree, root_go_obj, zipped_len = find_first_options(
         go_obj, root_key, split)
 
     # Find and add middle options to the tree structure
@@ -319,124 +390,119 @@ def keys_search(
 
     # Find and add last options to the tree structure
     tree, len_lv_3 = find_last_options(
-        tree, zipped, root_go_obj, root_key, split)
+        tree, zipped_len, root_go_obj, root_key, split)
+
+    # Return the interned tree components
+    parents, labels, ids = (
+        [sys.intern(item) for item in tree[key]]
+        for key in ("parents", "labels", "ids"))
+    return parents, labels, ids, (zipped_len, len_lv_2, len_lv_3)
 
-    # Return the tree components
-    return tree["parents"], tree["labels"], tree["ids"], \
-        (zipped_len, len_lv_2, len_lv_3)
+
+class GoInfo(NamedTuple):
+    """Information about a Plotly graph object listed in `GO_INFO`.
+
+    :param object_type: The Plotly graph object type (e.g., go.Bar)
+    :param url_post: The URL post section
+    :param url_pre_section: The URL pre-section
+    :param doc_page_url: The documentation page URL
+    :param doc_url_base: The documentation URL up to the section anchor
+    """
+    object_type: type
+    url_post: str
+    url_pre_section: str
+    doc_page_url: str
+    doc_url_base: str
 
 
 def create_go_info_item(
     object_type: go,
     url_post: Optional[str] = None,
     url_pre_section: Optional[str] = None
-) -> Dict[str, Any]:
-    """Generate a sub-dictionary for a Plotly graph object.
+) -> GoInfo:
+    """Generate the information item for a Plotly graph object.
 
     :param object_type: The Plotly graph object type (e.g., go.Bar)
     :param url_post: The URL post section (optional)
     :param url_pre_section: The URL pre-section (optional)
-    :return: A dictionary with 'object', 'url_post', and 'url_pre_section'
+    :return: A `GoInfo` with the object type and its documentation URLs
     """
-    item: Dict[str, Any] = {'object': object_type()}
-
     if url_post is None:
         url_post = object_type.__name__.lower()
     if url_pre_section is None:
         url_pre_section = url_post
 
-    item['url_post'] = url_post
-    item['url_pre_section'] = url_pre_section
-
-    return item
-
-
-GO_INFO = {
-    'Bar': create_go_info_item(go.Bar),
-    'Barpolar': create_go_info_item(go.Barpolar),
-    'Box': create_go_info_item(go.Box),
-    'Candlestick': create_go_info_item(go.Candlestick),
-    'Carpet': create_go_info_item(go.Carpet),
-    'Choropleth': create_go_info_item(go.Choropleth),
-    'Choroplethmapbox': create_go_info_item(go.Choroplethmapbox),
-    'Cone': create_go_info_item(go.Cone),
-    'Contour': create_go_info_item(go.Contour),
-    'Contourcarpet': create_go_info_item(go.Contourcarpet),
-    'Densitymapbox': create_go_info_item(go.Densitymapbox),
-    'Figure': create_go_info_item(go.Figure),
-    'FigureWidget': create_go_info_item(go.FigureWidget),
-    'Frame': create_go_info_item(go.Frame),
-    'Funnel': create_go_info_item(go.Funnel),
-    'Funnelarea': create_go_info_item(go.Funnelarea),
-    'Heatmap': create_go_info_item(go.Heatmap),
-    'Heatmapgl': create_go_info_item(go.Heatmapgl),
-    'Histogram': create_go_info_item(go.Histogram),
-    'Histogram2d': create_go_info_item(go.Histogram2d),
-    'Histogram2dContour': create_go_info_item(go.Histogram2dContour),
-    'Icicle': create_go_info_item(go.Icicle),
-    'Image': create_go_info_item(go.Image),
-    'Indicator': create_go_info_item(go.Indicator),
-    'Isosurface': create_go_info_item(go.Isosurface),
-
-    'Layout': create_go_info_item(go.Layout),
-    'Annotation': create_go_info_item(
-        go.layout.Annotation, 'layout/annotations',
-        'layout-annotations-items-annotation'),
-    'Coloraxis': create_go_info_item(
-        go.layout.Coloraxis, 'layout/coloraxis', 'layout-coloraxis'),
-    'Geo': create_go_info_item(
-        go.layout.Geo, 'layout/geo', 'layout-geo'),
-    'Layout_Image': create_go_info_item(
-        go.layout.Image, 'layout/images', 'layout-images-items-image'),
-    'Mapbox': create_go_info_item(
-        go.layout.Mapbox, 'layout/mapbox', 'layout-mapbox'),
-    'Polar': create_go_info_item(
-        go.layout.Polar, 'layout/polar', 'layout-polar'),
-    'Scene': create_go_info_item(
-        go.layout.Scene, 'layout/scene', 'layout-scene'),
-    'Selections': create_go_info_item(
-        go.layout.Selection, 'layout/selections',
-        'layout-selections-items-selection'),
-    'Shapes': create_go_info_item(
-        go.layout.Shape, 'layout/shapes', 'layout-shapes-items-shape'),
-    'Sliders': create_go_info_item(
-        go.layout.Slider, 'layout/sliders', 'layout-sliders-items-slider'),
-    'Smith': create_go_info_item(
-        go.layout.Smith, 'layout/smith', 'layout-smith'),
-    'Ternary': create_go_info_item(
-        go.layout.Ternary, 'layout/ternary', 'layout-ternary'),
-    'Updatemenus': create_go_info_item(
-        go.layout.Updatemenu, 'layout/updatemenus',
-        'layout-updatemenus-items-updatemenu'),
-    'XAxis': create_go_info_item(
-        go.layout.XAxis, 'layout/xaxis', 'layout-xaxis'),
-    'YAxis': create_go_info_item(
-        go.layout.YAxis, 'layout/yaxis', 'layout-yaxis'),
-
-    'Mesh3d': create_go_info_item(go.Mesh3d),
-    'Ohlc': create_go_info_item(go.Ohlc),
-    'Parcats': create_go_info_item(go.Parcats),
-    'Parcoords': create_go_info_item(go.Parcoords),
-    'Pie': create_go_info_item(go.Pie),
-    'Pointcloud': create_go_info_item(go.Pointcloud),
-    'Sankey': create_go_info_item(go.Sankey),
-    'Scatter': create_go_info_item(go.Scatter),
-    'Scatter3d': create_go_info_item(go.Scatter3d),
-    'Scattercarpet': create_go_info_item(go.Scattercarpet),
-    'Scattergeo': create_go_info_item(go.Scattergeo),
-    'Scattergl': create_go_info_item(go.Scattergl),
-    'Scattermapbox': create_go_info_item(go.Scattermapbox),
-    'Scatterpolar': create_go_info_item(go.Scatterpolar),
-    'Scatterpolargl': create_go_info_item(go.Scatterpolargl),
-    'Scattersmith': create_go_info_item(go.Scattersmith),
-    'Scatterternary': create_go_info_item(go.Scatterternary),
-    'Splom': create_go_info_item(go.Splom),
-    'Streamtube': create_go_info_item(go.Streamtube),
-    'Sunburst': create_go_info_item(go.Sunburst),
-    'Surface': create_go_info_item(go.Surface),
-    'Table': create_go_info_item(go.Table),
-    'Treemap': create_go_info_item(go.Treemap),
-    'Violin': create_go_info_item(go.Violin),
-    'Volume': create_go_info_item(go.Volume),
-    'Waterfall': create_go_info_item(go.Waterfall),
-}
+    doc_page_url = f"{DOC_URL_PRE}{url_post}/"
+
+    return GoInfo(
+        object_type, url_post, url_pre_section, doc_page_url,
+        f"{doc_page_url}#{url_pre_section}")
+
+
+# Graph objects in display order. A name alone is a `go` type with its own
+# reference page; layout items give (name, type, url_post, url_pre_section).
+GO_INFO_TABLE = (
+    'Bar', 'Barpolar', 'Box', 'Candlestick', 'Carpet', 'Choropleth',
+    'Choroplethmapbox', 'Cone', 'Contour', 'Contourcarpet', 'Densitymapbox',
+    'Figure', 'FigureWidget', 'Frame', 'Funnel', 'Funnelarea', 'Heatmap',
+    'Heatmapgl', 'Histogram', 'Histogram2d', 'Histogram2dContour', 'Icicle',
+    'Image', 'Indicator', 'Isosurface',
+
+    'Layout',
+    ('Annotation', go.layout.Annotation, 'layout/annotations',
+     'layout-annotations-items-annotation'),
+    ('Coloraxis', go.layout.Coloraxis, 'layout/coloraxis', 'layout-coloraxis'),
+    ('Geo', go.layout.Geo, 'layout/geo', 'layout-geo'),
+    ('Layout_Image', go.layout.Image, 'layout/images',
+     'layout-images-items-image'),
+    ('Mapbox', go.layout.Mapbox, 'layout/mapbox', 'layout-mapbox'),
+    ('Polar', go.layout.Polar, 'layout/polar', 'layout-polar'),
+    ('Scene', go.layout.Scene, 'layout/scene', 'layout-scene'),
+    ('Selections', go.layout.Selection, 'layout/selections',
+     'layout-selections-items-selection'),
+    ('Shapes', go.layout.Shape, 'layout/shapes', 'layout-shapes-items-shape'),
+    ('Sliders', go.layout.Slider, 'layout/sliders',
+     'layout-sliders-items-slider'),
+    ('Smith', go.layout.Smith, 'layout/smith', 'layout-smith'),
+    ('Ternary', go.layout.Ternary, 'layout/ternary', 'layout-ternary'),
+    ('Updatemenus', go.layout.Updatemenu, 'layout/updatemenus',
+     'layout-updatemenus-items-updatemenu'),
+    ('XAxis', go.layout.XAxis, 'layout/xaxis', 'layout-xaxis'),
+    ('YAxis', go.layout.YAxis, 'layout/yaxis', 'layout-yaxis'),
+
+    'Mesh3d', 'Ohlc', 'Parcats', 'Parcoords', 'Pie', 'Pointcloud', 'Sankey',
+    'Scatter', 'Scatter3d', 'Scattercarpet', 'Scattergeo', 'Scattergl',
+    'Scattermapbox', 'Scatterpolar', 'Scatterpolargl', 'Scattersmith',
+    'Scatterternary', 'Splom', 'Streamtube', 'Sunburst', 'Surface', 'Table',
+    'Treemap', 'Violin', 'Volume', 'Waterfall',
+)
+
+GO_INFO = dict(
+    (entry, create_go_info_item(getattr(go, entry)))
+    if isinstance(entry, str) else (entry[0], create_go_info_item(*entry[1:]))
+    for entry in GO_INFO_TABLE)
+
+
+@lru_cache(maxsize=None)
+def get_go_object(name: str) -> go:
+    """Get the Plotly graph object instance of a `GO_INFO` entry.
+
+    The graph objects are only instantiated on first use, since building
+    their validators is the slowest part of importing this module.
+
+    :param name: A `GO_INFO` key (e.g., 'Bar')
+    :return: The cached instance of the graph object type
+    """
+    return GO_INFO[name].object_type()
+
+
+def get_template() -> go.Layout:
+    """Get a copy of the default layout template.
+
+    `TEMPLATE` is shared by every caller, so it must not be updated in
+    place. Callers that need to customize the layout should update the
+    copy returned here instead.
+
+    :return: A new `go.Layout` with the properties of `TEMPLATE`
+    """
+    return go.Layout(TEMPLATE)
@@ -1,15 +1,92 @@
 """Web utils module."""
 
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+import re
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 
+SECTION_CACHE_TTL = 24 * 60 * 60
+SECTION_CACHE_SIZE = 4096
+SECTION_CHUNK_SIZE = 64 * 1024
+SECTION_WORKERS = 16
 
+# Shared so that repeated checks reuse pooled connections; the pool holds
+# one connection per worker, since every check goes to the same host
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_maxsize=SECTION_WORKERS))
+SESSION.mount('http://', HTTPAdapter(pool_maxsize=SECTION_WORKERS))
+
+
+def ttl_cache(ttl, maxsize):
+    """Memoize a single argument function, expiring results after `ttl`.
+
+    None results are not cached, so failed lookups are retried.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(arg):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(arg)
+                if hit is not None and hit[0] > now:
+                    cache.move_to_end(arg)
+                    return hit[1]
+            result = func(arg)
+            if result is None:
+                return result
+            with lock:
+                cache[arg] = (now + ttl, result)
+                cache.move_to_end(arg)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+@ttl_cache(SECTION_CACHE_TTL, SECTION_CACHE_SIZE)
 def check_section_exists(url):
-    """check_section_exists"""
-    section_id = url.split('#')[-1]
+    """Check if the page at `url` has an element with the url fragment id.
+
+    The page is streamed and searched for the id attribute as raw bytes,
+    stopping at the first match. Returns None if the page can't be fetched.
+    """
+    section_id = url.split('#')[-1].encode()
+    pattern = re.compile(
+        rb'(?<![\w-])id=["\']?' + re.escape(section_id) + rb'(?=["\'\s>])')
+    overlap = len(section_id) + 8
     try:
-        response = requests.get(url, timeout=5)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with SESSION.get(url, timeout=5, stream=True) as response:
+            tail = b''
+            for chunk in response.iter_content(SECTION_CHUNK_SIZE):
+                data = tail + chunk
+                if pattern.search(data):
+                    return True
+                tail = data[-overlap:]
     except requests.RequestException:
-        pass
-    return soup.find(id=section_id) is not None
+        return None
+    return False
+
+
+def check_sections_exist(urls, max_workers=SECTION_WORKERS):
+    """Run `check_section_exists` for many urls concurrently.
+
+    Each distinct url is checked once, in a thread pool, and results are
+    shared with the `check_section_exists` cache. Workers are capped at
+    `SECTION_WORKERS`, the connection pool size of `SESSION`. Returns a
+    dict mapping each url to its result.
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    with ThreadPoolExecutor(
+            max_workers=min(max_workers, SECTION_WORKERS)) as executor:
+        return dict(zip(
+            unique_urls, executor.map(check_section_exists, unique_urls)))